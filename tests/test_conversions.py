@@ -0,0 +1,82 @@
+# Conversion checks for units.py (run with: python -m pytest)
+# Importing units runs the Streamlit script in bare mode; the default "Unit Converter" page renders nothing without a click.
+
+from decimal import Decimal
+
+import pytest
+from pint import UnitRegistry
+from pint.errors import DimensionalityError
+
+import units
+
+# (value, from unit, to unit, result at 10 decimal places)
+KNOWN_CONVERSIONS = [
+    ("2.718", "acre_intl", "hectare", "1.0999355756"),
+    ("3.14159", "gallon_us", "liter", "11.8922118065"),
+    ("1", "barrel_oil_us", "gallon_imp", "34.9723157544"),
+    ("123.456", "pound", "kilogram", "55.9986996307"),
+    ("0.9876", "ton_short", "tonne", "0.8959356492"),
+    ("37.5", "degC", "degF", "99.5"),
+    ("88.6", "kilometer/hour", "mile_per_hour", "55.0534876322"),
+    ("1013.25", "millibar", "pascal", "101325"),
+    ("5000", "joule", "calorie", "1195.0286806883"),
+    ("8.5", "liter_per_100_kilometer", "mile_per_gallon_us", "27.6723038824"),
+    ("1024", "MiB", "MB", "1073.741824"),
+    ("180", "degree", "radian", "3.1415926536"),
+    ("1.23456789e-10", "meter", "nanometer", "0.123456789"),
+    ("1234567890123", "byte", "TB", "1.2345678901"),
+    ("-40", "degF", "degC", "-40"),
+    ("1", "byte", "bit", "8"),
+    ("3", "foot", "yard", "1"),
+]
+
+# Energy and power share a category but not a dimension
+POWER_UNITS = {"watt"}
+
+ALL_PAIRS = [
+    (a, b)
+    for cat, unit_list in units.CATEGORIES.items()
+    for a in unit_list
+    for b in unit_list
+]
+
+def _incompatible(a, b):
+    return (a in POWER_UNITS) != (b in POWER_UNITS)
+
+@pytest.mark.parametrize("value, from_unit, to_unit, expected", KNOWN_CONVERSIONS)
+def test_known_conversion(value, from_unit, to_unit, expected):
+    assert units.convert(Decimal(value), from_unit, to_unit, 10) == expected
+
+@pytest.mark.parametrize("from_unit, to_unit", ALL_PAIRS)
+def test_category_pair_round_trip(from_unit, to_unit):
+    if _incompatible(from_unit, to_unit):
+        with pytest.raises(DimensionalityError):
+            units.convert(Decimal("1.5"), from_unit, to_unit, 30)
+        return
+    there = units.convert(Decimal("1.5"), from_unit, to_unit, 30)
+    back = Decimal(units.convert(Decimal(there), to_unit, from_unit, 30))
+    assert abs(back - Decimal("1.5")) < Decimal("1e-9")
+
+def _factors(cache_folder):
+    """
+    Conversion factor (or error name) for every non-temperature CATEGORIES pair,
+    from a registry built like units.get_registry() with the given disk cache.
+    """
+    kwargs = {} if cache_folder is None else {"cache_folder": cache_folder}
+    u = UnitRegistry(non_int_type=Decimal, auto_reduce_dimensions=False, **kwargs)
+    u.load_definitions(units.EXTRA_DEFS_FILE)
+    out = {}
+    for a, b in ALL_PAIRS:
+        if a in units.CATEGORIES["Temperature"]:
+            continue
+        try:
+            out[a, b] = u.Quantity(Decimal(1), a).to(b).magnitude
+        except Exception as e:
+            out[a, b] = type(e).__name__
+    return out
+
+def test_disk_cache_does_not_change_results(tmp_path):
+    cold = _factors(str(tmp_path))
+    warm = _factors(str(tmp_path))
+    uncached = _factors(None)
+    assert cold == warm == uncached
@@ -3,17 +3,34 @@
 # Save as units.py and run with: streamlit run units.py
 
 import streamlit as st
-from decimal import Decimal, getcontext, InvalidOperation
+from decimal import Decimal, Context, getcontext, localcontext, InvalidOperation
 from pint import UnitRegistry
 from pint.errors import UndefinedUnitError
-from mpmath import mp
-import io, json, csv, hashlib, base64, binascii, urllib.parse, html
-import pandas as pd
+import os, sys, importlib.util, json, hashlib, collections, warnings, base64, urllib.parse, html
+import numpy as np
+from itertools import chain
+
+try:
+    import gmpy2  # optional: GMP-backed base conversion for very large integers
+except ImportError:
+    gmpy2 = None
 
 # ----------------------------
 # CONFIG
 # ----------------------------
-getcontext().prec = 200
+DISPLAY_PREC_MAX = 60  # upper bound of the "Display precision" slider
+# Working precision keeps guard digits beyond anything the slider can display
+getcontext().prec = DISPLAY_PREC_MAX + 20
+
+# The C implementation (_decimal, backed by libmpdec) is needed for acceptable Decimal speed
+if importlib.util.find_spec("_decimal") is None:
+    warnings.warn("C decimal module (libmpdec) not available; Decimal arithmetic will be slow.")
+
+# Number Bases accepts integers far beyond CPython's default 4300-digit int<->str limit;
+# still capped, since decimal parsing/printing is quadratic without GMP
+BASES_MAX_DIGITS = 100_000
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(BASES_MAX_DIGITS)
 
 GITHUB_OWNER = "LiborBenes-US"
 GITHUB_REPO = "Units"
@@ -30,127 +47,27 @@ st.markdown("**Converter: U.S. & Metric Units** — ad-free, comprehensive, and
 # ----------------------------
 # UNIT REGISTRY (pint) + extras
 # ----------------------------
-ureg = UnitRegistry()
-Q_ = ureg.Quantity
-
-EXTRA_DEFS = """
-# Length (NIST SP 811, Handbook 44)
-nautical_mile = 1852 * meter = nmi
-statute_mile = 1609.344 * meter
-mile_us_survey = 1609.347218694 * meter
-foot_us_survey = 0.3048006096 * meter
-inch = 0.0254 * meter
-yard = 0.9144 * meter
-
-# Area (NIST SP 811)
-acre_intl = 4046.8564224 * meter**2
-acre_us_survey = 4046.872609874 * meter**2
-
-# Volume (NIST SP 811, Handbook 44)
-gallon_us = 3.785411784 * liter
-fluid_ounce_us = 0.0295735295625 * liter
-cup_us = 0.2365882365 * liter
-pint_us = 0.473176473 * liter
-quart_us = 0.946352946 * liter
-fluid_ounce_imp = 0.0284130625 * liter
-pint_imp = 0.56826125 * liter
-quart_imp = 1.1365225 * liter
-gallon_imp = 4.54609 * liter
-teaspoon_us = 0.00492892159375 * liter
-tablespoon_us = 0.01478676478125 * liter
-tablespoon_metric = 0.015 * liter
-tablespoon_au = 0.02 * liter
-barrel_oil_us = 158.987294928 * liter
-barrel_beer_us = 117.347765304 * liter
-barrel_beer_uk = 163.65924 * liter
-
-# Mass (NIST SP 811)
-pound = 0.45359237 * kilogram
-ton_short = 907.18474 * kilogram
-ton_long = 1016.0469088 * kilogram
-tonne = 1000 * kilogram = t
-quintal = 100 * kilogram = q
-ounce = 0.028349523125 * kilogram
-stone = 6.35029318 * kilogram
-
-# Speed (derived from NIST length/time)
-knot = 0.514444444 * meter/second
-mile_per_hour = 0.44704 * meter/second
-
-# Pressure (NIST SP 811)
-bar = 100000 * pascal
-millibar = 100 * pascal = mbar
-atmosphere = 101325 * pascal
-mmHg = 133.322387415 * pascal
-psi = 6894.757293168 * pascal
-
-# Energy & Power (NIST SP 811)
-calorie = 4.184 * joule
-kcal = 4184 * joule
-BTU = 1055.05585262 * joule
-watt_hour = 3600 * joule
-kilowatt_hour = 3600000 * joule
-
-# Fuel Economy (derived from NIST length/volume)
-mile_per_gallon_us = statute_mile / gallon_us = mpg_us
-mile_per_gallon_imp = statute_mile / gallon_imp = mpg_imp
-# Define as consumption (volume per distance) - pint will handle the inverse relationship
-liter_per_100_kilometer = (100 * liter) / kilometer = L/100km
-
-# Digital Storage (IEC/SI standards)
-byte = [information]
-kB = 1000 * byte
-MB = 1000000 * byte
-GB = 1000000000 * byte
-TB = 1000000000000 * byte
-PB = 1000000000000000 * byte
-KiB = 1024 * byte
-MiB = 1048576 * byte
-GiB = 1073741824 * byte
-TiB = 1099511627776 * byte
-PiB = 1125899906842624 * byte
-
-# Angle (NIST SP 811)
-degree = 0.0174532925199433 * radian
-grad = 0.015707963267949 * radian
-"""
-
-for line in EXTRA_DEFS.splitlines():
-    line = line.strip()
-    if line and not line.startswith('#'):
-        ureg.define(line)
-
-# Debug conversions
-def debug_conversion(value, from_unit, to_unit):
+# Loaded by pint as a definitions file (one parser pass per process)
+EXTRA_DEFS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extra_defs.txt")
+# pint keeps parsed definition files here, so later cold starts skip the parser.
+# Derived Decimal factors are computed at the active precision, so the cache is keyed on it.
+PINT_CACHE_DIR = os.path.join(os.path.dirname(EXTRA_DEFS_FILE), ".pint_cache", f"decimal{getcontext().prec}")
+
+@st.cache_resource
+def get_registry():
+    """
+    Build the pint registry with the extra definitions once per server process.
+    """
     try:
-        q_from = quantity_from_decimal(Decimal(str(value)), from_unit)
-        if q_from is None:
-            print(f"Failed to create quantity for {value} {from_unit}")
-            return
-        q_to = q_from.to(to_unit)
-        print(f"{value} {from_unit} = {q_to.magnitude} {to_unit}")
-    except Exception as e:
-        print(f"Error converting {value} {from_unit} to {to_unit}: {e}")
-
-debug_tests = [
-    (2.718, "acre_intl", "hectare"),
-    (3.14159, "gallon_us", "liter"),
-    (1, "barrel_oil_us", "gallon_imp"),
-    (123.456, "pound", "kilogram"),
-    (0.9876, "ton_short", "tonne"),
-    (37.5, "degC", "degF"),
-    (88.6, "kilometer/hour", "mile_per_hour"),
-    (1013.25, "millibar", "pascal"),
-    (5000, "joule", "calorie"),
-    (8.5, "liter_per_100_kilometer", "mile_per_gallon_us"),
-    (1024, "MiB", "MB"),
-    (180, "degree", "radian"),
-    (1.23456789e-10, "meter", "nanometer"),
-    (1234567890123, "byte", "TB"),
-    (-40, "degF", "degC"),
-]
-for value, from_unit, to_unit in debug_tests:
-    debug_conversion(value, from_unit, to_unit)
+        u = UnitRegistry(non_int_type=Decimal, cache_folder=PINT_CACHE_DIR, auto_reduce_dimensions=False)
+    except OSError:
+        # Read-only deployment: parse without the on-disk cache
+        u = UnitRegistry(non_int_type=Decimal, auto_reduce_dimensions=False)
+    u.load_definitions(EXTRA_DEFS_FILE)
+    return u
+
+ureg = get_registry()
+Q_ = ureg.Quantity
 
 # ----------------------------
 # Manual fuel economy conversion functions
@@ -213,28 +130,68 @@ CATEGORIES = {
     "Angle": ["degree", "radian", "grad"]
 }
 
+_LBL_TBL = str.maketrans({"_": " ", "*": "·"})
+
 def pretty_unit_label(u):
-    lab = (u.replace("**2", "²")
-           .replace("**3", "³")
-           .replace("_", " ")
-           .replace("*", "·")
-           .replace("liter_per_100_kilometer", "liter/100 km")
-           .replace("mile_per_gallon_us", "mile/gallon (US)")
-           .replace("mile_per_gallon_imp", "mile/gallon (Imp)")
-           .replace("barrel_oil_us", "barrel (US oil)")
-           .replace("barrel_beer_us", "barrel (US beer)")
-           .replace("barrel_beer_uk", "barrel (UK beer)"))
-    return lab
+    return u.replace("**2", "²").replace("**3", "³").translate(_LBL_TBL)
+
+@st.cache_resource
+def get_pretty_labels():
+    """
+    Pretty labels for every unit in CATEGORIES, computed once per server process.
+    """
+    return {u: pretty_unit_label(u) for u in set(chain.from_iterable(CATEGORIES.values()))}
+
+PRETTY_LABELS = get_pretty_labels()
+
+@st.cache_resource
+def get_category_labels():
+    """
+    For every category: display labels (in CATEGORIES order) and a label -> unit map.
+    Built once per server process, so the first paint of any category is already warm.
+    """
+    out = {}
+    for cat, units in CATEGORIES.items():
+        labs = [PRETTY_LABELS[u] + f"  ({u})" for u in units]
+        out[cat] = (labs, dict(zip(labs, units)))
+    return out
+
+CATEGORY_LABELS = get_category_labels()
+
+@st.cache_resource
+def get_unit_objs():
+    """
+    Parsed pint Units for every unit in CATEGORIES, so conversions skip pint's string parser.
+    """
+    return {u: ureg.Unit(u) for u in chain.from_iterable(CATEGORIES.values())}
+
+UNIT_OBJS = get_unit_objs()
 
 # ----------------------------
 # SESSION STATE: history
 # ----------------------------
 if "history" not in st.session_state:
-    st.session_state.history = []
+    st.session_state.history = collections.deque(maxlen=500)
+if "history_version" not in st.session_state:
+    st.session_state.history_version = 0
 
 def add_history(obj):
-    st.session_state.history.insert(0, obj)
-    st.session_state.history = st.session_state.history[:500]
+    st.session_state.history.appendleft(obj)
+    st.session_state.history_version += 1
+
+def history_exports():
+    """
+    Session history as (DataFrame, JSON text, CSV text), rebuilt only when the history has changed.
+    Kept in session_state (not st.cache_data, which is shared by all sessions).
+    """
+    cached = st.session_state.get("history_exports")
+    if cached is None or cached[0] != st.session_state.history_version:
+        import pandas as pd  # deferred: only the ASCII table and history pages need pandas
+        history = list(st.session_state.history)
+        df = pd.DataFrame(history)
+        cached = (st.session_state.history_version, df, json.dumps(history, indent=2), df.to_csv(index=False))
+        st.session_state.history_exports = cached
+    return cached[1:]
 
 # ----------------------------
 # LAYOUT: sidebar tools
@@ -268,14 +225,26 @@ def quantity_from_decimal(value_decimal, unit_str):
     Create a pint Quantity from a Decimal and unit string with high precision.
     """
     try:
-        mp.dps = 50
-        value_float = mp.mpf(str(value_decimal))
-        q = Q_(float(value_float), unit_str)
-        return q
+        return Q_(value_decimal, get_unit(unit_str))
     except Exception as e:
         st.error(f"Quantity creation error: {e}")
         return None
 
+# Helper: Decimal quanta for 0..DISPLAY_PREC_MAX decimal places, built once per server process
+@st.cache_resource
+def get_quantizers():
+    return tuple(Decimal(1).scaleb(-p) for p in range(DISPLAY_PREC_MAX + 1))
+
+QUANTIZERS = get_quantizers()
+
+def _quantizer(precision):
+    if 0 <= precision < len(QUANTIZERS):
+        return QUANTIZERS[precision]
+    return Decimal(1).scaleb(-precision)
+
+# Helper: rounds pint results to the digits that are free of arithmetic noise
+_SIGNIFICANT = Context(prec=getcontext().prec - 5)
+
 # Helper: format result with proper precision
 def format_result(value, precision):
     """
@@ -285,10 +254,19 @@ def format_result(value, precision):
         if hasattr(value, 'magnitude'):
             value = value.magnitude
         if isinstance(value, Decimal):
-            dec_val = value
+            # Drop the last working digits, which carry accumulated rounding error
+            dec_val = _SIGNIFICANT.plus(value)
         else:
             dec_val = Decimal(str(value))
-        quantized = dec_val.quantize(Decimal('0.' + '0' * precision))
+        # quantize needs room for all integer digits plus the requested decimals;
+        # only widen the context when the default precision is not enough
+        needed = dec_val.adjusted() + precision + 2
+        if needed <= getcontext().prec:
+            quantized = dec_val.quantize(_quantizer(precision))
+        else:
+            with localcontext() as ctx:
+                ctx.prec = needed
+                quantized = dec_val.quantize(_quantizer(precision))
         return format(quantized, 'f').rstrip('0').rstrip('.')
     except:
         try:
@@ -296,6 +274,89 @@ def format_result(value, precision):
         except:
             return str(value)
 
+# Helper: parsed pint Unit per unit string (prebuilt for every unit in CATEGORIES)
+def get_unit(unit_str):
+    unit = UNIT_OBJS.get(unit_str)
+    return unit if unit is not None else ureg.Unit(unit_str)
+
+# Helper: multiplicative conversion factor per unit pair, computed once per server process
+@st.cache_resource
+def get_factor(from_unit, to_unit):
+    """
+    Return the Decimal factor converting from_unit to to_unit, or None for
+    temperatures, whose offset scales need the full pint conversion.
+    """
+    u_from, u_to = get_unit(from_unit), get_unit(to_unit)
+    if u_from.dimensionality == get_unit("kelvin").dimensionality:
+        return None
+    return Q_(Decimal(1), u_from).to(u_to).magnitude
+
+# Helper: full conversion pipeline, memoized per (value, units, precision)
+@st.cache_data(max_entries=1024)
+def convert(dec_val, from_unit, to_unit, prec):
+    """
+    Convert the already-parsed Decimal dec_val from from_unit to to_unit and return the formatted result.
+    Raises on failure so that errors are never cached.
+    """
+    # Fuel economy conversions need manual handling
+    fuel_units = ["liter_per_100_kilometer", "mile_per_gallon_us", "mile_per_gallon_imp"]
+    if from_unit == to_unit:
+        result = dec_val
+    elif from_unit in fuel_units and to_unit in fuel_units:
+        result = convert_fuel_economy(dec_val, from_unit, to_unit)
+        if result is None:
+            raise ValueError("Unsupported fuel economy conversion")
+    else:
+        factor = get_factor(from_unit, to_unit)
+        if factor is not None:
+            result = dec_val * factor
+        else:
+            q_from = quantity_from_decimal(dec_val, from_unit)
+            if q_from is None:
+                raise ValueError("Failed to create quantity.")
+            result = q_from.to(to_unit).magnitude
+    return format_result(result, prec)
+
+# Helper: constant ASCII table, built once per server process and shared by reference
+@st.cache_resource
+def ascii_table_df():
+    import pandas as pd  # deferred: only the ASCII table and history pages need pandas
+    codes = range(128)
+    return pd.DataFrame({
+        "hex": [f"{i:X}" for i in codes],
+        "oct": [f"{i:o}" for i in codes],
+        "bin": [f"{i:07b}" for i in codes],
+        "char": [chr(i) if 32 <= i < 127 else "" for i in codes]
+    }, index=pd.RangeIndex(128, name="dec"))
+
+# Helper: hash constructors bound once per algorithm
+_HASHERS = {"md5": hashlib.md5, "sha1": hashlib.sha1, "sha256": hashlib.sha256, "sha512": hashlib.sha512}
+
+# Helper: bytes -> 8 binary digits per byte, expanded in NumPy instead of a per-byte Python loop.
+# Each LUT entry packs the 8 ASCII digits of one byte value into a uint64, so expansion is a single gather.
+_BIN_LUT = np.frombuffer(b"".join(f"{b:08b}".encode("ascii") for b in range(256)), dtype=np.uint64)
+
+def bytes_to_bin(data):
+    return _BIN_LUT[np.frombuffer(data, dtype=np.uint8)].tobytes().decode("ascii")
+
+# Helper: integer -> digit string in base 2/8/10/16 (GMP when available, linear-ish for huge inputs).
+# Parsing stays on int(s, base) so the accepted input does not depend on gmpy2 being installed.
+_BASE_FMT = {2: "b", 8: "o", 10: "d", 16: "x"}
+
+def _to_str(n, base):
+    if gmpy2 is not None:
+        return gmpy2.mpz(n).digits(base)
+    return format(n, _BASE_FMT[base])
+
+# Number Bases page: selector name -> radix, and -> output formatter
+BASE_MAP = {"decimal": 10, "binary": 2, "octal": 8, "hexadecimal": 16}
+OUT_FMT = {
+    "decimal": lambda n: _to_str(n, 10),
+    "binary": lambda n: _to_str(n, 2),
+    "octal": lambda n: _to_str(n, 8),
+    "hexadecimal": lambda n: _to_str(n, 16).upper()
+}
+
 # ----------------------------
 # TOOL: Unit Converter
 # ----------------------------
@@ -308,19 +369,18 @@ if tool == "Unit Converter":
     )
 
     cat = st.selectbox("Category", list(CATEGORIES.keys()))
-    units_for_cat = CATEGORIES[cat]
-    labels = [pretty_unit_label(u) + f"  ({u})" for u in units_for_cat]
+    labels, lab2unit = CATEGORY_LABELS[cat]
 
     col_a, col_b, col_c = st.columns([3, 3, 2])
     with col_a:
         from_choice = st.selectbox("From unit", labels, index=0)
-        from_unit = units_for_cat[labels.index(from_choice)]
+        from_unit = lab2unit[from_choice]
     with col_b:
         to_choice = st.selectbox("To unit", labels, index=1 if len(labels) > 1 else 0)
-        to_unit = units_for_cat[labels.index(to_choice)]
+        to_unit = lab2unit[to_choice]
     with col_c:
         raw_text = st.text_input("Value (Decimal allowed)", "1")
-        prec = st.slider("Display precision (decimal places)", 3, 60, 8)
+        prec = st.slider("Display precision (decimal places)", 3, DISPLAY_PREC_MAX, 8)
         convert_btn = st.button("Convert")
 
     if convert_btn:
@@ -329,41 +389,17 @@ if tool == "Unit Converter":
             st.error("Invalid numeric input. Use digits, optional decimal point, or scientific notation (e.g. 1.23e-4).")
         else:
             try:
-                # Check if this is a fuel economy conversion that needs manual handling
-                fuel_units = ["liter_per_100_kilometer", "mile_per_gallon_us", "mile_per_gallon_imp"]
-                if from_unit in fuel_units and to_unit in fuel_units:
-                    manual_result = convert_fuel_economy(dec_val, from_unit, to_unit)
-                    if manual_result is not None:
-                        formatted = format_result(manual_result, prec)
-                        out_str = f"{dec_val} {from_unit} = {formatted} {to_unit}"
-                        st.success(out_str)
-                        add_history({
-                            "tool": "unit",
-                            "category": cat,
-                            "from": from_unit,
-                            "to": to_unit,
-                            "value": str(dec_val),
-                            "result": formatted
-                        })
-                    else:
-                        st.error("Unsupported fuel economy conversion")
-                else:
-                    q_from = quantity_from_decimal(dec_val, from_unit)
-                    if q_from is None:
-                        st.error("Failed to create quantity.")
-                    else:
-                        q_to = q_from.to(to_unit)
-                        formatted = format_result(q_to.magnitude, prec)
-                        out_str = f"{dec_val} {from_unit} = {formatted} {to_unit}"
-                        st.success(out_str)
-                        add_history({
-                            "tool": "unit",
-                            "category": cat,
-                            "from": from_unit,
-                            "to": to_unit,
-                            "value": str(dec_val),
-                            "result": formatted
-                        })
+                formatted = convert(dec_val, from_unit, to_unit, prec)
+                out_str = f"{dec_val} {from_unit} = {formatted} {to_unit}"
+                st.success(out_str)
+                add_history({
+                    "tool": "unit",
+                    "category": cat,
+                    "from": from_unit,
+                    "to": to_unit,
+                    "value": str(dec_val),
+                    "result": formatted
+                })
             except UndefinedUnitError as e:
                 st.error(f"Undefined unit: {e}")
             except Exception as e:
@@ -382,33 +418,24 @@ elif tool == "Number Bases (bin/oct/dec/hex)":
         base_to = st.selectbox("To base", ["binary", "octal", "decimal", "hexadecimal"])
     with col3:
         if st.button("Convert"):
-            def parse_base(s, base):
-                s = s.strip()
-                try:
-                    if base == "decimal":
-                        return int(s, 10)
-                    if base == "binary":
-                        return int(s, 2)
-                    if base == "octal":
-                        return int(s, 8)
-                    if base == "hexadecimal":
-                        return int(s, 16)
-                except Exception:
-                    return None
-            n = parse_base(input_text, base_from)
-            if n is None:
+            try:
+                n = int(input_text.strip(), BASE_MAP[base_from])
+            except Exception:
+                n = None
+            if n is None and base_from == "decimal" and len(input_text.strip()) > BASES_MAX_DIGITS:
+                st.error(f"Input is too long (limit: {BASES_MAX_DIGITS} decimal digits).")
+            elif n is None:
                 st.error("Invalid input for selected base.")
             else:
-                if base_to == "decimal":
-                    out = str(n)
-                elif base_to == "binary":
-                    out = bin(n)[2:]
-                elif base_to == "octal":
-                    out = oct(n)[2:]
-                elif base_to == "hexadecimal":
-                    out = hex(n)[2:].upper()
-                st.success(f"{input_text} ({base_from}) → {out} ({base_to})")
-                add_history({"tool":"bases","from":base_from,"to":base_to,"input":input_text,"output":out})
+                try:
+                    out = OUT_FMT[base_to](n)
+                except ValueError:
+                    out = None
+                if out is None:
+                    st.error(f"Result is too large to display (limit: {BASES_MAX_DIGITS} decimal digits).")
+                else:
+                    st.success(f"{input_text} ({base_from}) → {out} ({base_to})")
+                    add_history({"tool":"bases","from":base_from,"to":base_to,"input":input_text,"output":out})
 
 # ----------------------------
 # TOOL: ASCII / Unicode
@@ -417,28 +444,18 @@ elif tool == "ASCII / Unicode":
     st.header("🔡 ASCII / Unicode Code Points")
     sub = st.radio("Mode", ["ASCII table (0-127)", "Char → codes", "Code → Char (Unicode)"])
     if sub == "ASCII table (0-127)":
-        df = []
-        for i in range(128):
-            ch = chr(i)
-            display_char = ch if 32 <= i < 127 else ""
-            df.append({
-                "dec": i,
-                "hex": hex(i)[2:].upper(),
-                "oct": oct(i)[2:],
-                "bin": bin(i)[2:].zfill(7),
-                "char": display_char
-            })
-        st.dataframe(pd.DataFrame(df).set_index("dec"), width="stretch")
+        st.dataframe(ascii_table_df(), width="stretch")
     elif sub == "Char → codes":
         s = st.text_input("Type characters (first character will be used)", "")
         if s != "":
             ch = s[0]
             st.write("Character:", html.escape(ch))
-            st.write("Dec:", ord(ch))
-            st.write("Hex:", hex(ord(ch))[2:].upper())
-            st.write("Oct:", oct(ord(ch))[2:])
-            st.write("Bin:", bin(ord(ch))[2:])
-            add_history({"tool":"ascii_char","char":ch,"dec":ord(ch)})
+            code = ord(ch)
+            st.write("Dec:", code)
+            st.write("Hex:", f"{code:X}")
+            st.write("Oct:", f"{code:o}")
+            st.write("Bin:", f"{code:b}")
+            add_history({"tool":"ascii_char","char":ch,"dec":code})
     else:
         n = st.text_input("Enter Unicode code point (decimal)", "65")
         try:
@@ -469,7 +486,7 @@ elif tool == "Encodings & Hashes":
         with c2:
             if st.button("Decode Base64"):
                 try:
-                    dec = base64.b64decode(txt).decode("utf8")
+                    dec = base64.b64decode("".join(txt.split()), validate=True).decode("utf8")
                     st.code(dec)
                     add_history({"tool":"base64","mode":"dec","in":txt,"out":dec})
                 except Exception:
@@ -495,17 +512,21 @@ elif tool == "Encodings & Hashes":
             text = st.text_input("Text to hash", "Hello")
             algo = st.selectbox("Algorithm", ["md5", "sha1", "sha256", "sha512"])
             if st.button("Hash Text"):
-                h = hashlib.new(algo, text.encode("utf8")).hexdigest()
+                h = _HASHERS[algo](text.encode("utf8")).hexdigest()
                 st.code(h)
                 add_history({"tool":"hash_text","algo":algo,"in":text,"out":h})
         else:
             f = st.file_uploader("Upload file to hash", type=None)
             algo = st.selectbox("Algorithm", ["md5", "sha1", "sha256", "sha512"], key="filehash_algo")
             if f is not None and st.button("Compute file hash"):
-                hasher = hashlib.new(algo)
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-                h = hasher.hexdigest()
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    h = hashlib.file_digest(f, _HASHERS[algo]).hexdigest()
+                else:
+                    hasher = _HASHERS[algo]()
+                    mv = memoryview(bytearray(1 << 20))
+                    while n := f.readinto(mv):
+                        hasher.update(mv[:n])
+                    h = hasher.hexdigest()
                 st.code(h)
                 add_history({"tool":"hash_file","filename":f.name,"algo":algo,"out":h})
 
@@ -514,20 +535,20 @@ elif tool == "Encodings & Hashes":
         c1, c2, c3 = st.columns(3)
         with c1:
             if st.button("To Hex"):
-                hx = binascii.hexlify(s.encode("utf8")).decode("ascii").upper()
+                hx = s.encode("utf8").hex().upper()
                 st.code(hx)
                 add_history({"tool":"tx2hex","in":s,"out":hx})
         with c2:
             if st.button("From Hex"):
                 try:
-                    txt = binascii.unhexlify(s).decode("utf8")
+                    txt = bytes.fromhex(s).decode("utf8")
                     st.code(txt)
                     add_history({"tool":"hex2tx","in":s,"out":txt})
                 except Exception:
                     st.error("Invalid hex input.")
         with c3:
             if st.button("To Bin"):
-                bx = ''.join(format(b, '08b') for b in s.encode("utf8"))
+                bx = bytes_to_bin(s.encode("utf8"))
                 st.code(bx)
                 add_history({"tool":"tx2bin","in":s,"out":bx})
 
@@ -565,20 +586,10 @@ if "show_history" in st.session_state and st.session_state.get("show_history"):
     if not st.session_state.history:
         st.info("No history yet. Perform some conversions or utilities to populate the session history.")
     else:
-        df = pd.DataFrame(st.session_state.history)
+        df, js, csv_str = history_exports()
         st.dataframe(df.head(200), width="stretch")
-        js = json.dumps(st.session_state.history, indent=2)
         st.download_button("⬇️ Download history (JSON)", data=js, file_name="units_history.json", mime="application/json")
-        csv_buf = io.StringIO()
-        writer = csv.writer(csv_buf)
-        keys = set()
-        for row in st.session_state.history:
-            keys.update(row.keys())
-        keys = list(keys)
-        writer.writerow(keys)
-        for row in st.session_state.history:
-            writer.writerow([row.get(k, "") for k in keys])
-        st.download_button("⬇️ Download history (CSV)", data=csv_buf.getvalue(), file_name="units_history.csv", mime="text/csv")
+        st.download_button("⬇️ Download history (CSV)", data=csv_str, file_name="units_history.csv", mime="text/csv")
 
 # ----------------------------
 # FOOTER / NOTES